@@ -16,14 +16,41 @@ Environment variables:
     SUPERSET_URL            (default: http://localhost:8088)
     SUPERSET_ADMIN_USERNAME (default: admin)
     SUPERSET_ADMIN_PASSWORD (default: admin)
+    SUPERSET_ID_CACHE       (default: /tmp/dynamo-superset-id-cache.json)
+    SUPERSET_INIT_WORKERS   (default: 8)
 """
 
+import concurrent.futures
 import json
+import logging
 import os
+import random
 import sys
 import time
 
 import requests
+from urllib3.util.retry import Retry
+
+# orjson is noticeably faster than stdlib json on the small dicts this
+# script encodes, but it is not part of the Superset image; fall back to
+# stdlib when it is missing.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    _json_loads = json.loads
+
+# Diagnostics go through logging with deferred %-formatting so message
+# strings are only interpolated when the record is actually emitted.
+log = logging.getLogger(__name__)
 
 # =============================================================================
 # Configuration
@@ -35,10 +62,28 @@ ADMIN_PASS = os.environ.get("SUPERSET_ADMIN_PASSWORD", "admin")
 
 DATABASE_NAME = "Dynamo AI"
 
+# Concurrency for the dataset/chart creation fan-out.
+MAX_WORKERS = int(os.environ.get("SUPERSET_INIT_WORKERS", "8"))
+
+# Object IDs from previous runs are cached here so re-runs skip the
+# existence lookups entirely.
+ID_CACHE_PATH = os.environ.get(
+    "SUPERSET_ID_CACHE", "/tmp/dynamo-superset-id-cache.json"
+)
+
 # =============================================================================
 # Superset API client
 # =============================================================================
 
+# Pre-rendered template for the single-eq-filter queries used by the find_*
+# probes; interpolating into it beats rebuilding and re-encoding the same
+# dict on every call. The value is still JSON-encoded so quoting stays safe.
+_EQ_FILTER_TMPL = '{"filters":[{"col":"%s","opr":"eq","value":%s}]}'
+
+
+def _eq_filter(col: str, value: str) -> str:
+    return _EQ_FILTER_TMPL % (col, _json_dumps(value))
+
 
 class SupersetClient:
     """Minimal Superset REST API client."""
@@ -46,8 +91,30 @@ class SupersetClient:
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+        # The default adapter keeps only 10 pooled connections; size it for
+        # the creation fan-out so parallel workers reuse warm sockets
+        # instead of re-opening them, and retry transient gateway errors.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET", "POST", "PUT"],
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Some load balancers close idle connections unless asked not to.
+        self.session.headers["Connection"] = "keep-alive"
+        # Every mutating request sends JSON; set the header once instead of
+        # rebuilding a headers dict per call. The Authorization and
+        # X-CSRFToken headers are likewise cached on the session by login().
+        self.session.headers["Content-Type"] = "application/json"
         self.csrf_token = None
         self.access_token = None
+        self._database_ids: dict[str, int | None] = {}
 
     # ── Auth ─────────────────────────────────────────────────────────────
 
@@ -67,68 +134,106 @@ class SupersetClient:
         self.session.headers.update(
             {"Authorization": f"Bearer {self.access_token}"}
         )
-        # Fetch CSRF token for mutating requests
-        csrf_resp = self.session.get(
-            f"{self.base_url}/api/v1/security/csrf_token/"
-        )
-        csrf_resp.raise_for_status()
-        self.csrf_token = csrf_resp.json()["result"]
+        # Some deployments hand the CSRF token back as a cookie on login;
+        # use it when present and only pay the extra csrf_token round trip
+        # when it is absent.
+        self.csrf_token = self.session.cookies.get(
+            "csrf_token"
+        ) or self.session.cookies.get("XSRF-TOKEN")
+        if not self.csrf_token:
+            csrf_resp = self.session.get(
+                f"{self.base_url}/api/v1/security/csrf_token/"
+            )
+            csrf_resp.raise_for_status()
+            self.csrf_token = csrf_resp.json()["result"]
         self.session.headers.update({"X-CSRFToken": self.csrf_token})
 
     # ── Generic helpers ──────────────────────────────────────────────────
 
+    def _find_bulk(self, path: str, col: str, values: list[str]) -> dict[str, int]:
+        """Resolve many names to IDs with a single `in`-filter query."""
+        if not values:
+            return {}
+        data = self.get(
+            path,
+            params={
+                "q": _json_dumps(
+                    {
+                        "filters": [{"col": col, "opr": "in", "value": values}],
+                        "page_size": 100,
+                    }
+                )
+            },
+        )
+        return {row[col]: row["id"] for row in data.get("result", [])}
+
     def get(self, path: str, **kwargs) -> dict:
         resp = self.session.get(f"{self.base_url}{path}", **kwargs)
         resp.raise_for_status()
         return resp.json()
 
     def post(self, path: str, payload: dict) -> dict:
-        resp = self.session.post(
-            f"{self.base_url}{path}",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-        )
+        resp = self.session.post(f"{self.base_url}{path}", json=payload)
         if resp.status_code == 422:
-            # Already exists — not an error
-            return resp.json()
+            # Already exists — not an error. The 422 body never carries an
+            # object ID, so skip parsing it and hand callers a sentinel;
+            # they recover the real ID via their single-name find_* probe.
+            return {"_duplicate": True}
         resp.raise_for_status()
         return resp.json()
 
     def put(self, path: str, payload: dict) -> dict:
-        resp = self.session.put(
-            f"{self.base_url}{path}",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-        )
+        resp = self.session.put(f"{self.base_url}{path}", json=payload)
         resp.raise_for_status()
         return resp.json()
 
     # ── Database ─────────────────────────────────────────────────────────
 
     def get_database_id(self, name: str) -> int | None:
+        # Memoized: the ID is stable for the lifetime of the client, so
+        # repeat callers don't pay another round trip.
+        if name in self._database_ids:
+            return self._database_ids[name]
         data = self.get(
             "/api/v1/database/",
-            params={"q": json.dumps({"filters": [{"col": "database_name", "opr": "eq", "value": name}]})},
+            params={"q": _eq_filter("database_name", name)},
         )
         results = data.get("result", [])
-        return results[0]["id"] if results else None
+        db_id = results[0]["id"] if results else None
+        if db_id is not None:
+            self._database_ids[name] = db_id
+        return db_id
 
     # ── Datasets ─────────────────────────────────────────────────────────
 
     def find_dataset(self, table_name: str) -> int | None:
         data = self.get(
             "/api/v1/dataset/",
-            params={"q": json.dumps({"filters": [{"col": "table_name", "opr": "eq", "value": table_name}]})},
+            params={"q": _eq_filter("table_name", table_name)},
         )
         results = data.get("result", [])
         return results[0]["id"] if results else None
 
-    def create_dataset(self, database_id: int, table_name: str, sql: str, description: str = "") -> int:
+    def find_datasets_bulk(self, table_names: list[str]) -> dict[str, int]:
+        """Look up many datasets in one request. Returns {table_name: id}."""
+        return self._find_bulk("/api/v1/dataset/", "table_name", table_names)
+
+    def create_dataset(
+        self,
+        database_id: int,
+        table_name: str,
+        sql: str,
+        description: str = "",
+        existing: dict[str, int] | None = None,
+    ) -> int:
         """Create a virtual (SQL) dataset. Returns the dataset ID."""
         # Check if dataset with this name already exists
-        existing_id = self.find_dataset(table_name)
+        if existing is not None:
+            existing_id = existing.get(table_name)
+        else:
+            existing_id = self.find_dataset(table_name)
         if existing_id:
-            print(f"    Dataset '{table_name}' already exists (id={existing_id}), skipping.")
+            log.info("    Dataset '%s' already exists (id=%s), skipping.", table_name, existing_id)
             return existing_id
 
         payload = {
@@ -139,12 +244,19 @@ class SupersetClient:
             "schema": None,
         }
         resp = self.post("/api/v1/dataset/", payload)
+        if resp.get("_duplicate"):
+            # Raced another creator (a concurrent init job, or created since
+            # the bulk prefetch): fetch the real ID instead of returning 0,
+            # which would make every dependent chart get skipped.
+            dataset_id = self.find_dataset(table_name) or 0
+            log.info("    Dataset '%s' already exists (id=%s), skipping.", table_name, dataset_id)
+            return dataset_id
         dataset_id = resp.get("id")
         if dataset_id:
-            print(f"    Created dataset '{table_name}' (id={dataset_id}).")
+            log.info("    Created dataset '%s' (id=%s).", table_name, dataset_id)
         else:
             # Try to extract ID from response
-            print(f"    Dataset '{table_name}' response: {resp}")
+            log.info("    Dataset '%s' response: %s", table_name, resp)
             dataset_id = resp.get("result", {}).get("id", 0)
         return dataset_id
 
@@ -153,16 +265,34 @@ class SupersetClient:
     def find_chart(self, name: str) -> int | None:
         data = self.get(
             "/api/v1/chart/",
-            params={"q": json.dumps({"filters": [{"col": "slice_name", "opr": "eq", "value": name}]})},
+            params={"q": _eq_filter("slice_name", name)},
         )
         results = data.get("result", [])
         return results[0]["id"] if results else None
 
-    def create_chart(self, name: str, viz_type: str, dataset_id: int, params: dict) -> int:
-        """Create a chart (slice). Returns the chart ID."""
-        existing_id = self.find_chart(name)
+    def find_charts_bulk(self, names: list[str]) -> dict[str, int]:
+        """Look up many charts in one request. Returns {slice_name: id}."""
+        return self._find_bulk("/api/v1/chart/", "slice_name", names)
+
+    def create_chart(
+        self,
+        name: str,
+        viz_type: str,
+        dataset_id: int,
+        params: dict | str,
+        existing: dict[str, int] | None = None,
+    ) -> int:
+        """Create a chart (slice). Returns the chart ID.
+
+        `params` may be passed pre-serialized as a JSON string to avoid
+        re-encoding a static dict on every call.
+        """
+        if existing is not None:
+            existing_id = existing.get(name)
+        else:
+            existing_id = self.find_chart(name)
         if existing_id:
-            print(f"    Chart '{name}' already exists (id={existing_id}), skipping.")
+            log.info("    Chart '%s' already exists (id=%s), skipping.", name, existing_id)
             return existing_id
 
         payload = {
@@ -170,11 +300,15 @@ class SupersetClient:
             "viz_type": viz_type,
             "datasource_id": dataset_id,
             "datasource_type": "table",
-            "params": json.dumps(params),
+            "params": params if isinstance(params, str) else _json_dumps(params),
         }
         resp = self.post("/api/v1/chart/", payload)
+        if resp.get("_duplicate"):
+            chart_id = self.find_chart(name) or 0
+            log.info("    Chart '%s' already exists (id=%s), skipping.", name, chart_id)
+            return chart_id
         chart_id = resp.get("id", resp.get("result", {}).get("id", 0))
-        print(f"    Created chart '{name}' (id={chart_id}).")
+        log.info("    Created chart '%s' (id=%s).", name, chart_id)
         return chart_id
 
     # ── Dashboards ───────────────────────────────────────────────────────
@@ -182,16 +316,29 @@ class SupersetClient:
     def find_dashboard(self, title: str) -> int | None:
         data = self.get(
             "/api/v1/dashboard/",
-            params={"q": json.dumps({"filters": [{"col": "dashboard_title", "opr": "eq", "value": title}]})},
+            params={"q": _eq_filter("dashboard_title", title)},
         )
         results = data.get("result", [])
         return results[0]["id"] if results else None
 
-    def create_dashboard(self, title: str, slug: str, chart_ids: list[int]) -> int:
+    def find_dashboards_bulk(self, titles: list[str]) -> dict[str, int]:
+        """Look up many dashboards in one request. Returns {dashboard_title: id}."""
+        return self._find_bulk("/api/v1/dashboard/", "dashboard_title", titles)
+
+    def create_dashboard(
+        self,
+        title: str,
+        slug: str,
+        chart_ids: list[int],
+        existing: dict[str, int] | None = None,
+    ) -> int:
         """Create a dashboard with the given charts arranged in a grid."""
-        existing_id = self.find_dashboard(title)
+        if existing is not None:
+            existing_id = existing.get(title)
+        else:
+            existing_id = self.find_dashboard(title)
         if existing_id:
-            print(f"    Dashboard '{title}' already exists (id={existing_id}), skipping.")
+            log.info("    Dashboard '%s' already exists (id=%s), skipping.", title, existing_id)
             return existing_id
 
         # Build a simple grid layout: 2 columns, charts stacked
@@ -201,11 +348,15 @@ class SupersetClient:
             "dashboard_title": title,
             "slug": slug,
             "published": True,
-            "position_json": json.dumps(position_json),
+            "position_json": _json_dumps(position_json),
         }
         resp = self.post("/api/v1/dashboard/", payload)
+        if resp.get("_duplicate"):
+            dash_id = self.find_dashboard(title) or 0
+            log.info("    Dashboard '%s' already exists (id=%s), skipping.", title, dash_id)
+            return dash_id
         dash_id = resp.get("id", resp.get("result", {}).get("id", 0))
-        print(f"    Created dashboard '{title}' (id={dash_id}).")
+        log.info("    Created dashboard '%s' (id=%s).", title, dash_id)
         return dash_id
 
     @staticmethod
@@ -215,9 +366,19 @@ class SupersetClient:
         GRID_ID = "GRID_ID"
         HEADER_ID = "HEADER_ID"
 
+        # Chunk the charts into rows of two and build each component dict
+        # directly, fully formed — no per-chart counter bookkeeping or
+        # append-as-you-go mutation.
+        rows = [chart_ids[i : i + 2] for i in range(0, len(chart_ids), 2)]
+
         layout = {
             ROOT_ID: {"type": "ROOT", "id": ROOT_ID, "children": [GRID_ID]},
-            GRID_ID: {"type": "GRID", "id": GRID_ID, "children": [], "parents": [ROOT_ID]},
+            GRID_ID: {
+                "type": "GRID",
+                "id": GRID_ID,
+                "children": [f"ROW-{row_idx}" for row_idx in range(len(rows))],
+                "parents": [ROOT_ID],
+            },
             HEADER_ID: {
                 "type": "HEADER",
                 "id": HEADER_ID,
@@ -226,42 +387,29 @@ class SupersetClient:
             "DASHBOARD_VERSION_KEY": "v2",
         }
 
-        row_idx = 0
-        col_in_row = 0
-        current_row_id = None
-
-        for chart_id in chart_ids:
-            # Start a new row every 2 charts
-            if col_in_row == 0:
-                current_row_id = f"ROW-{row_idx}"
-                layout[current_row_id] = {
-                    "type": "ROW",
-                    "id": current_row_id,
+        for row_idx, row in enumerate(rows):
+            row_id = f"ROW-{row_idx}"
+            layout[row_id] = {
+                "type": "ROW",
+                "id": row_id,
+                "children": [f"CHART-{chart_id}" for chart_id in row],
+                "parents": [ROOT_ID, GRID_ID],
+                "meta": {"background": "BACKGROUND_TRANSPARENT"},
+            }
+            for chart_id in row:
+                chart_component_id = f"CHART-{chart_id}"
+                layout[chart_component_id] = {
+                    "type": "CHART",
+                    "id": chart_component_id,
                     "children": [],
-                    "parents": [ROOT_ID, GRID_ID],
-                    "meta": {"background": "BACKGROUND_TRANSPARENT"},
+                    "parents": [ROOT_ID, GRID_ID, row_id],
+                    "meta": {
+                        "chartId": chart_id,
+                        "width": 6,  # half of 12-column grid
+                        "height": 50,
+                        "sliceName": "",
+                    },
                 }
-                layout[GRID_ID]["children"].append(current_row_id)
-
-            chart_component_id = f"CHART-{chart_id}"
-            layout[chart_component_id] = {
-                "type": "CHART",
-                "id": chart_component_id,
-                "children": [],
-                "parents": [ROOT_ID, GRID_ID, current_row_id],
-                "meta": {
-                    "chartId": chart_id,
-                    "width": 6,  # half of 12-column grid
-                    "height": 50,
-                    "sliceName": "",
-                },
-            }
-            layout[current_row_id]["children"].append(chart_component_id)
-
-            col_in_row += 1
-            if col_in_row >= 2:
-                col_in_row = 0
-                row_idx += 1
 
         return layout
 
@@ -814,6 +962,18 @@ CHARTS = {
     },
 }
 
+# The chart params are static, so serialize them once at import instead of
+# on every create_chart call.
+for _chart in CHARTS.values():
+    _chart["params_json"] = _json_dumps(_chart["params"])
+
+# Flattened (name, dataset_key, viz_type, params_json) tuples so the creation
+# loop reads positionally instead of doing per-chart dict key lookups.
+CHART_SPECS = [
+    (name, spec["dataset"], spec["viz_type"], spec["params_json"])
+    for name, spec in CHARTS.items()
+]
+
 
 # =============================================================================
 # Dashboard Definitions
@@ -869,19 +1029,65 @@ DASHBOARDS = [
 # =============================================================================
 
 
+def _read_id_cache_file() -> dict:
+    """Read the whole {url: {kind: {name: id}}} cache file, if any."""
+    try:
+        with open(ID_CACHE_PATH) as f:
+            cache = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def load_id_cache(url: str) -> dict:
+    """Load the {kind: {name: id}} maps cached for one Superset instance.
+
+    The cache is keyed by instance URL so a run against a different
+    Superset never replays IDs that only exist elsewhere.
+    """
+    entry = _read_id_cache_file().get(url.rstrip("/"), {})
+    return entry if isinstance(entry, dict) else {}
+
+
+def save_id_cache(url: str, id_cache: dict) -> None:
+    """Persist one instance's ID maps for the next run (best effort)."""
+    cache = _read_id_cache_file()
+    cache[url.rstrip("/")] = id_cache
+    try:
+        with open(ID_CACHE_PATH, "w") as f:
+            f.write(_json_dumps(cache))
+    except OSError as e:
+        log.warning("    Could not write ID cache to %s: %s", ID_CACHE_PATH, e)
+
+
 def wait_for_superset(url: str, max_retries: int = 60) -> None:
     """Wait for Superset to be reachable."""
-    print(f"==> Waiting for Superset at {url}...")
+    log.info("==> Waiting for Superset at %s...", url)
+    delay = 0.5
+    use_head = True
     for attempt in range(max_retries):
         try:
-            resp = requests.get(f"{url}/health", timeout=5)
+            # Only the status code matters, so poll with HEAD to skip the
+            # body transfer; fall back to a streamed GET closed unread for
+            # servers that don't implement HEAD on /health.
+            if use_head:
+                resp = requests.head(f"{url}/health", timeout=5)
+                if resp.status_code in (405, 501):
+                    use_head = False
+            if not use_head:
+                resp = requests.get(f"{url}/health", timeout=5, stream=True)
+                resp.close()
             if resp.status_code == 200:
-                print("==> Superset is ready.")
+                log.info("==> Superset is ready.")
                 return
         except requests.ConnectionError:
             pass
-        time.sleep(2)
-    print(f"ERROR: Superset did not become ready after {max_retries} attempts.")
+        # Full-jitter exponential backoff: probe quickly while Superset is
+        # nearly up, back off toward 10s during a long cold start, and
+        # avoid synchronized retries when several init jobs race.
+        time.sleep(random.uniform(0, delay))
+        delay = min(delay * 2, 10.0)
+    log.error("Superset did not become ready after %s attempts.", max_retries)
     sys.exit(1)
 
 
@@ -891,67 +1097,153 @@ def main() -> None:
     client = SupersetClient(SUPERSET_URL)
 
     # ── Authenticate ─────────────────────────────────────────────────────
-    print(f"==> Logging in as '{ADMIN_USER}'...")
+    log.info("==> Logging in as '%s'...", ADMIN_USER)
     client.login(ADMIN_USER, ADMIN_PASS)
-    print("==> Authenticated.")
+    log.info("==> Authenticated.")
 
     # ── Resolve database ID ──────────────────────────────────────────────
-    print(f"==> Looking up database '{DATABASE_NAME}'...")
+    log.info("==> Looking up database '%s'...", DATABASE_NAME)
     db_id = client.get_database_id(DATABASE_NAME)
     if db_id is None:
-        print(f"ERROR: Database '{DATABASE_NAME}' not found in Superset.")
-        print("    Run scripts/init-superset.sh first to register it.")
+        log.error("Database '%s' not found in Superset.", DATABASE_NAME)
+        log.error("    Run scripts/init-superset.sh first to register it.")
         sys.exit(1)
-    print(f"==> Found database '{DATABASE_NAME}' (id={db_id}).")
-
-    # ── Create datasets ──────────────────────────────────────────────────
-    print("==> Creating datasets...")
-    dataset_ids: dict[str, int] = {}
-    for name, defn in DATASETS.items():
-        dataset_ids[name] = client.create_dataset(
-            database_id=db_id,
-            table_name=name,
-            sql=defn["sql"],
-            description=defn["description"],
-        )
-    print(f"==> {len(dataset_ids)} datasets ready.")
-
-    # ── Create charts ────────────────────────────────────────────────────
-    print("==> Creating charts...")
-    chart_ids: dict[str, int] = {}
-    for name, defn in CHARTS.items():
-        ds_key = defn["dataset"]
-        ds_id = dataset_ids.get(ds_key, 0)
-        if ds_id == 0:
-            print(f"    WARNING: Dataset '{ds_key}' not found for chart '{name}', skipping.")
-            continue
-        chart_ids[name] = client.create_chart(
-            name=name,
-            viz_type=defn["viz_type"],
-            dataset_id=ds_id,
-            params=defn["params"],
-        )
-    print(f"==> {len(chart_ids)} charts ready.")
-
-    # ── Create dashboards ────────────────────────────────────────────────
-    print("==> Creating dashboards...")
-    for dash_def in DASHBOARDS:
-        ids = [chart_ids[c] for c in dash_def["charts"] if c in chart_ids]
-        client.create_dashboard(
-            title=dash_def["title"],
-            slug=dash_def["slug"],
-            chart_ids=ids,
-        )
-    print(f"==> {len(DASHBOARDS)} dashboards ready.")
+    log.info("==> Found database '%s' (id=%s).", DATABASE_NAME, db_id)
+
+    id_cache = load_id_cache(SUPERSET_URL)
+
+    # Objects within each phase are independent of each other, so the
+    # blocking HTTP calls fan out over a thread pool instead of paying one
+    # round trip per object. requests.Session is thread-safe as long as
+    # headers are only mutated before the workers start, which login()
+    # guarantees. One pool serves all three phases, so the worker threads
+    # (and the warm sockets pinned to them) are reused instead of being
+    # torn down and respawned between phases.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Superset has no bulk-create endpoints, so creation stays one POST
+        # per object — but the three bulk existence lookups only need names,
+        # so they are issued together up front instead of one per phase.
+        existing_datasets = dict(id_cache.get("datasets", {}))
+        existing_charts = dict(id_cache.get("charts", {}))
+        existing_dashboards = dict(id_cache.get("dashboards", {}))
+        lookup_futures = {}
+        uncached = [name for name in DATASETS if name not in existing_datasets]
+        if uncached:
+            lookup_futures["datasets"] = executor.submit(
+                client.find_datasets_bulk, uncached
+            )
+        uncached = [name for name in CHARTS if name not in existing_charts]
+        if uncached:
+            lookup_futures["charts"] = executor.submit(
+                client.find_charts_bulk, uncached
+            )
+        uncached = [
+            dash_def["title"]
+            for dash_def in DASHBOARDS
+            if dash_def["title"] not in existing_dashboards
+        ]
+        if uncached:
+            lookup_futures["dashboards"] = executor.submit(
+                client.find_dashboards_bulk, uncached
+            )
+        if "datasets" in lookup_futures:
+            existing_datasets.update(lookup_futures["datasets"].result())
+        if "charts" in lookup_futures:
+            existing_charts.update(lookup_futures["charts"].result())
+        if "dashboards" in lookup_futures:
+            existing_dashboards.update(lookup_futures["dashboards"].result())
+
+        # ── Create datasets ──────────────────────────────────────────────
+        log.info("==> Creating datasets...")
+        dataset_futures = {
+            name: executor.submit(
+                client.create_dataset,
+                database_id=db_id,
+                table_name=name,
+                sql=defn["sql"],
+                description=defn["description"],
+                existing=existing_datasets,
+            )
+            for name, defn in DATASETS.items()
+        }
+        dataset_ids: dict[str, int] = {
+            name: future.result() for name, future in dataset_futures.items()
+        }
+        id_cache["datasets"] = {
+            name: ds_id for name, ds_id in dataset_ids.items() if ds_id
+        }
+        log.info("==> %s datasets ready.", len(dataset_ids))
+
+        # ── Create charts ────────────────────────────────────────────────
+        log.info("==> Creating charts...")
+        chart_futures: dict[str, concurrent.futures.Future] = {}
+        for name, ds_key, viz_type, params_json in CHART_SPECS:
+            ds_id = dataset_ids.get(ds_key, 0)
+            if ds_id == 0:
+                log.warning("    Dataset '%s' not found for chart '%s', skipping.", ds_key, name)
+                continue
+            chart_futures[name] = executor.submit(
+                client.create_chart,
+                name=name,
+                viz_type=viz_type,
+                dataset_id=ds_id,
+                params=params_json,
+                existing=existing_charts,
+            )
+        chart_ids: dict[str, int] = {
+            name: future.result() for name, future in chart_futures.items()
+        }
+        id_cache["charts"] = {name: c_id for name, c_id in chart_ids.items() if c_id}
+        log.info("==> %s charts ready.", len(chart_ids))
+
+        # ── Create dashboards ────────────────────────────────────────────
+        log.info("==> Creating dashboards...")
+        # Resolve each dashboard's chart list against the in-memory map in
+        # one pass, then fan out. Dashboards depend on chart IDs but not on
+        # each other.
+        dashboard_chart_ids = {
+            dash_def["title"]: [
+                chart_id
+                for chart_id in (chart_ids.get(c) for c in dash_def["charts"])
+                if chart_id
+            ]
+            for dash_def in DASHBOARDS
+        }
+        dashboard_futures = {
+            dash_def["title"]: executor.submit(
+                client.create_dashboard,
+                title=dash_def["title"],
+                slug=dash_def["slug"],
+                chart_ids=dashboard_chart_ids[dash_def["title"]],
+                existing=existing_dashboards,
+            )
+            for dash_def in DASHBOARDS
+        }
+        dashboard_ids = {
+            title: future.result() for title, future in dashboard_futures.items()
+        }
+        id_cache["dashboards"] = {
+            title: d_id for title, d_id in dashboard_ids.items() if d_id
+        }
+        log.info("==> %s dashboards ready.", len(DASHBOARDS))
+
+    save_id_cache(SUPERSET_URL, id_cache)
 
     # ── Summary ──────────────────────────────────────────────────────────
-    print("")
-    print("==> Dashboard initialization complete!")
-    print(f"    Superset URL: {SUPERSET_URL}")
-    print(f"    Dashboards:")
-    for dash_def in DASHBOARDS:
-        print(f"      - {dash_def['title']}: {SUPERSET_URL}/superset/dashboard/{dash_def['slug']}/")
+    # Emitted as one record so the block hits stdout in a single write.
+    summary = [
+        "",
+        "==> Dashboard initialization complete!",
+        f"    Superset URL: {SUPERSET_URL}",
+        "    Dashboards:",
+    ]
+    summary.extend(
+        f"      - {dash_def['title']}: {SUPERSET_URL}/superset/dashboard/{dash_def['slug']}/"
+        for dash_def in DASHBOARDS
+    )
+    log.info("\n".join(summary))
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
@@ -18,6 +18,37 @@ from typing import Optional
 import requests
 from pydantic import BaseModel, Field
 
+# Map Open WebUI roles to Claude Engine roles. Built once at import;
+# pipe() only does a lookup per request.
+ROLE_MAP = {
+    "admin": "admin",
+    "user": "business",
+    "pending": "business",
+}
+
+# Thousands-separator formatter, bound once instead of compiling the same
+# format spec inside an f-string on every call.
+_fmt_thousands = "{:,}".format
+
+# Progress bar segments for _format_budget, built once at import; per call
+# the bar is just two slices of these.
+_BAR_SLOTS = 20
+_BAR_EXCEEDED = "#" * _BAR_SLOTS
+_BAR_FILLED = "=" * _BAR_SLOTS
+_BAR_EMPTY = "." * _BAR_SLOTS
+
+# Static markdown fragments of the budget summary, assembled once at import.
+_TABLE_HEADER = "| Metric | Value |\n|--------|-------|"
+_EXCEEDED_NOTICE = (
+    "Your monthly token budget has been exceeded. "
+    "Requests may be blocked depending on enforcement settings. "
+    "Contact your administrator to request an increase."
+)
+_WARNING_NOTICE = (
+    "You are approaching your monthly token budget limit. "
+    "Consider reducing usage or contact your administrator."
+)
+
 
 class Pipe:
     """Budget check function — shows token usage and remaining budget."""
@@ -35,6 +66,10 @@ class Pipe:
     def __init__(self):
         self.type = "pipe"
         self.valves = self.Valves()
+        # One session for the lifetime of the plugin, so repeat budget
+        # checks reuse a pooled keep-alive connection to Claude Engine
+        # instead of opening a fresh one per request.
+        self.session = requests.Session()
 
     def pipes(self) -> list[dict]:
         """Register this function as a selectable model."""
@@ -61,13 +96,7 @@ class Pipe:
         if not user_id:
             return "**Error**: Unable to determine your user ID."
 
-        # Map Open WebUI roles to Claude Engine roles
-        role_map = {
-            "admin": "admin",
-            "user": "business",
-            "pending": "business",
-        }
-        engine_role = role_map.get(user_role, "business")
+        engine_role = ROLE_MAP.get(user_role, "business")
 
         headers = {
             "Content-Type": "application/json",
@@ -79,7 +108,7 @@ class Pipe:
         url = f"{self.valves.CLAUDE_ENGINE_URL}/v1/budget/{user_id}"
 
         try:
-            r = requests.get(
+            r = self.session.get(
                 url,
                 headers=headers,
                 timeout=self.valves.REQUEST_TIMEOUT,
@@ -118,7 +147,7 @@ class Pipe:
         warning = budget.get("warningThreshold", False)
 
         # Format numbers with commas
-        usage_str = f"{current_usage:,}"
+        usage_str = _fmt_thousands(current_usage)
 
         if monthly_limit is None:
             limit_str = "Unlimited"
@@ -126,13 +155,12 @@ class Pipe:
             bar = ""
             status_emoji = "OK"
         else:
-            limit_str = f"{monthly_limit:,}"
-            remaining_str = f"{remaining:,}" if remaining is not None else "N/A"
+            limit_str = _fmt_thousands(monthly_limit)
+            remaining_str = _fmt_thousands(remaining) if remaining is not None else "N/A"
             # Progress bar
-            filled = min(int(percent_used / 5), 20)
-            empty = 20 - filled
-            bar_char = "#" if exceeded else "="
-            bar = f"`[{bar_char * filled}{'.' * empty}]` {percent_used}%"
+            filled = min(int(percent_used / 5), _BAR_SLOTS)
+            fill = _BAR_EXCEEDED if exceeded else _BAR_FILLED
+            bar = f"`[{fill[:filled]}{_BAR_EMPTY[filled:]}]` {percent_used}%"
             if exceeded:
                 status_emoji = "EXCEEDED"
             elif warning:
@@ -146,8 +174,7 @@ class Pipe:
             f"**Status**: {status_emoji}",
             f"**Role**: {role}",
             "",
-            "| Metric | Value |",
-            "|--------|-------|",
+            _TABLE_HEADER,
             f"| Used this month | {usage_str} tokens |",
             f"| Monthly limit | {limit_str} tokens |",
             f"| Remaining | {remaining_str} tokens |",
@@ -158,19 +185,8 @@ class Pipe:
             lines.extend(["", f"**Usage**: {bar}"])
 
         if exceeded:
-            lines.extend([
-                "",
-                "---",
-                "Your monthly token budget has been exceeded. "
-                "Requests may be blocked depending on enforcement settings. "
-                "Contact your administrator to request an increase.",
-            ])
+            lines.extend(["", "---", _EXCEEDED_NOTICE])
         elif warning:
-            lines.extend([
-                "",
-                "---",
-                "You are approaching your monthly token budget limit. "
-                "Consider reducing usage or contact your administrator.",
-            ])
+            lines.extend(["", "---", _WARNING_NOTICE])
 
         return "\n".join(lines)